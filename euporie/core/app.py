@@ -7,7 +7,7 @@ import json
 import logging
 import signal
 import sys
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import PurePath
 from typing import TYPE_CHECKING, cast
 from weakref import WeakSet, WeakValueDictionary
@@ -129,6 +129,18 @@ _COLOR_DEPTHS = {
 }
 
 
+@lru_cache
+def _edit_modes() -> dict[str, EditingMode]:
+    """Map edit mode configuration values to editing mode enums."""
+    from euporie.core.key_binding.bindings.micro import EditingMode
+
+    return {
+        "micro": EditingMode.MICRO,  # type: ignore
+        "vi": EditingMode.VI,
+        "emacs": EditingMode.EMACS,
+    }
+
+
 class CursorConfig(CursorShapeConfig):
     """Determine which cursor mode to use."""
 
@@ -733,16 +745,8 @@ class BaseApp(Application):
 
     def get_edit_mode(self) -> EditingMode:
         """Return the editing mode enum defined in the configuration."""
-        from euporie.core.key_binding.bindings.micro import EditingMode
-
-        return {
-            "micro": EditingMode.MICRO,  # type: ignore
-            "vi": EditingMode.VI,
-            "emacs": EditingMode.EMACS,
-        }.get(
-            str(self.config.edit_mode),
-            EditingMode.MICRO,  # type: ignore
-        )
+        edit_modes = _edit_modes()
+        return edit_modes.get(str(self.config.edit_mode), edit_modes["micro"])
 
     def update_edit_mode(self, setting: Setting | None = None) -> None:
         """Set the keybindings for editing mode."""
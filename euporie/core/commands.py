@@ -98,6 +98,8 @@ class Command:
 
         self.toggled = toggled
         self._menu: MenuItem | None = None
+        self._key_handler: KeyHandlerCallable | None = None
+        self._menu_handler: Callable[[], None] | None = None
 
         self.eager = to_filter(eager)
         self.is_global = to_filter(is_global)
@@ -134,6 +136,12 @@ class Command:
     @property
     def key_handler(self) -> KeyHandlerCallable:
         """Return a key handler for the command."""
+        if self._key_handler is None:
+            self._key_handler = self.load_key_handler()
+        return self._key_handler
+
+    def load_key_handler(self) -> KeyHandlerCallable:
+        """Wrap the command's handler so it can be used as a key-binding handler."""
         handler = self.handler
         sig = signature(handler)
 
@@ -190,8 +198,14 @@ class Command:
     @property
     def menu_handler(self) -> Callable[[], None]:
         """Return a menu handler for the command."""
+        if self._menu_handler is None:
+            self._menu_handler = self.load_menu_handler()
+        return self._menu_handler
+
+    def load_menu_handler(self) -> Callable[[], None]:
+        """Wrap the command's handler so it can be used as a menu item handler."""
         handler = self.handler
-        if isawaitable(handler):
+        if iscoroutinefunction(handler):
 
             def _menu_handler() -> None:
                 task = cast("CommandHandlerNoArgs", handler)()
@@ -221,6 +235,11 @@ def add_cmd(**kwargs: Any) -> Callable:
 
     def decorator(handler: Callable) -> Callable:
         cmd = Command(handler, **kwargs)
+        if (existing := commands.get(cmd.name)) is not None:
+            if existing.handler is handler:
+                log.warning("Command %r is registered more than once", cmd.name)
+            else:
+                log.debug("Command %r is being redefined", cmd.name)
         commands[cmd.name] = cmd
         return handler
 
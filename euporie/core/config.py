@@ -178,6 +178,7 @@ class Setting:
         self.hidden = to_filter(hidden)
         self.kwargs = kwargs
         self.cmd_filter = cmd_filter
+        self._menu: MenuItem | None = None
 
         self.event = Event(self)
         for hook in hooks or []:
@@ -300,14 +301,27 @@ class Setting:
 
     @property
     def menu(self) -> MenuItem:
-        """Return a menu item for the setting."""
+        """Return a menu item for the setting.
+
+        The menu item is only built once, as looking up and sorting the commands for
+        settings with many choices (e.g. the syntax theme) is relatively expensive.
+        For the same reason, the items for each choice are only created when the menu
+        is first displayed.
+        """
+        if self._menu is None:
+            self._menu = self.load_menu()
+        return self._menu
+
+    def load_menu(self) -> MenuItem:
+        """Create a menu item for the setting."""
         from euporie.core.widgets.menu import MenuItem
 
         choices = (self.choices or self.schema.get("enum", [])) or []
         if choices:
+            # The child items are only created when the menu is first displayed
             return MenuItem(
                 self.title.capitalize(),
-                children=[
+                children=lambda: tuple(
                     cmd.menu
                     for cmd in sorted(
                         (
@@ -316,7 +330,7 @@ class Setting:
                         ),
                         key=lambda x: x.menu_title,
                     )
-                ],
+                ),
                 description=self.help,
             )
         elif self.type in (bool, int):
@@ -364,6 +378,7 @@ class Config:
         """Create a new configuration object instance."""
         self.app_name: str = "base"
         self.app_cls: type[ConfigurableApp] | None = None
+        self._filters: dict[str, Filter] = {}
 
     def _save(self, setting: Setting) -> None:
         """Save settings to user's configuration file."""
@@ -576,8 +591,13 @@ class Config:
         return self.settings.get(name)
 
     def filter(self, name: str) -> Filter:
-        """Return a :py:class:`Filter` for a configuration item."""
-        return Condition(partial(self.get, name))
+        """Return a :py:class:`Filter` for a configuration item.
+
+        Filters are cached, so the same filter instance is returned for each item.
+        """
+        if (filter_ := self._filters.get(name)) is None:
+            filter_ = self._filters[name] = Condition(partial(self.get, name))
+        return filter_
 
     def __getattr__(self, name: str) -> Any:
         """Enable access of config elements via dotted attributes.
@@ -5,12 +5,15 @@ from __future__ import annotations
 import logging
 import mimetypes
 from functools import lru_cache
+from pathlib import PurePath
 from typing import TYPE_CHECKING
 
 from upath import UPath
 from upath._stat import UPathStatResult
 from upath.implementations.http import HTTPPath
 
+from euporie.core.convert.registry import BASE64_FORMATS, find_route
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -108,3 +111,25 @@ def get_format(path: Path | str, default: str = "") -> str:
         default = "html" if isinstance(path, HTTPPath) else "ansi"
     mime = get_mime(path)
     return MIME_FORMATS.get(mime, default) if mime else default
+
+
+@lru_cache
+def get_display_format(mime: str) -> str:
+    """Determine which data format to use when displaying data of a given mime-type.
+
+    Args:
+        mime: The mime-type of the data
+
+    Returns:
+        The first format matching the mime-type which can be converted to formatted
+        text, or ``"ansi"`` if there is none
+
+    """
+    mime_path = PurePath(mime)
+    for mime_type, data_format in MIME_FORMATS.items():
+        if mime_path.match(mime_type):
+            if data_format in BASE64_FORMATS:
+                data_format = f"base64-{data_format}"
+            if find_route(data_format, "ft") is not None:
+                return data_format
+    return "ansi"
@@ -110,6 +110,22 @@ def has_menus() -> bool:
 has_float = has_dialog | has_menus | has_completions
 
 
+@Condition
+def has_tabs() -> bool:
+    """Determine if there are any tabs open."""
+    from euporie.core.current import get_app
+
+    return bool(get_app().tabs)
+
+
+@Condition
+def has_multiple_tabs() -> bool:
+    """Determine if more than one tab is open."""
+    from euporie.core.current import get_app
+
+    return len(get_app().tabs) > 1
+
+
 @Condition
 def tab_has_focus() -> bool:
     """Determine if there is a currently focused tab."""
@@ -66,7 +66,17 @@ def fragment_list_width(fragments: StyleAndTextTuples) -> int:
 
 def max_line_width(ft: StyleAndTextTuples) -> int:
     """Calculate the length of the longest line in formatted text."""
-    return max(fragment_list_width(line) for line in split_lines(ft))
+    max_width = width = 0
+    for style, text, *_ in ft:
+        zero_width = any(x in style for x in _ZERO_WIDTH_FRAGMENTS)
+        first, *rest = text.split("\n")
+        if not zero_width:
+            width += get_cwidth(first)
+        for part in rest:
+            if width > max_width:
+                max_width = width
+            width = 0 if zero_width else get_cwidth(part)
+    return max(max_width, width)
 
 
 def last_char(ft: StyleAndTextTuples) -> str | None:
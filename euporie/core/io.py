@@ -131,6 +131,19 @@ class PseudoTTY:
         """
         self._underlying = underlying
         self._isatty = isatty
+        # Bind frequently used methods directly to avoid ``__getattr__`` look-ups
+        for name in (
+            "write",
+            "flush",
+            "fileno",
+            "writable",
+            "seek",
+            "tell",
+            "read",
+            "close",
+        ):
+            if (method := getattr(underlying, name, None)) is not None:
+                setattr(self, name, method)
 
     def isatty(self) -> bool:
         """Determine if the stream is interpreted as a TTY."""
@@ -412,10 +412,13 @@ class Renderer(PtkRenderer):
 
         # Expand size if required
         output_size = size
-        if self.extend_height():
-            output_size = Size(9999999, output_size.columns)
-        if self.extend_width():
-            output_size = Size(size.rows, output_size.columns + 1)
+        extend_height = self.extend_height()
+        extend_width = self.extend_width()
+        if extend_height or extend_width:
+            output_size = Size(
+                rows=9999999 if extend_height else size.rows,
+                columns=size.columns + 1 if extend_width else size.columns,
+            )
 
         # Process diff and write to output.
         self._cursor_pos, self._last_style = _output_screen_diff(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from pathlib import PurePath
 from typing import TYPE_CHECKING
 
@@ -16,9 +17,7 @@ from prompt_toolkit.layout.containers import (
 
 from euporie.core.config import add_setting
 from euporie.core.convert.datum import Datum
-from euporie.core.convert.formats import BASE64_FORMATS
-from euporie.core.convert.mime import MIME_FORMATS
-from euporie.core.convert.registry import find_route
+from euporie.core.convert.mime import get_display_format
 from euporie.core.current import get_app
 from euporie.core.layout.containers import HSplit
 from euporie.core.widgets.display import Display
@@ -45,6 +44,14 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+_BG_COLORS = {"light": "#FFFFFF", "dark": "#000000"}
+
+
+@lru_cache
+def _mime_style(mime: str) -> str:
+    """Return the style class for an output element displaying a mime type."""
+    return f"class:mime-{mime.replace('/', '-')}"
+
 
 class CellOutputElement(metaclass=ABCMeta):
     """Base class for the various types of cell outputs (display data or widgets)."""
@@ -101,20 +108,10 @@ class CellOutputDataElement(CellOutputElement):
         self.parent = parent
 
         # Get foreground and background colors
-        bg_color = {"light": "#FFFFFF", "dark": "#000000"}.get(
-            str(metadata.get("needs_background"))
-        )
+        bg_color = _BG_COLORS.get(str(metadata.get("needs_background")))
 
         # Get internal format
-        format_ = "ansi"
-        mime_path = PurePath(mime)
-        for mime_type, data_format in MIME_FORMATS.items():
-            if mime_path.match(mime_type):
-                if data_format in BASE64_FORMATS:
-                    data_format = f"base64-{data_format}"
-                if find_route(data_format, "ft") is not None:
-                    format_ = data_format
-                    break
+        format_ = get_display_format(mime)
 
         self._datum = Datum(
             data,
@@ -131,7 +128,7 @@ class CellOutputDataElement(CellOutputElement):
             focus_on_click=False,
             wrap_lines=config.filter("wrap_cell_outputs"),
             always_hide_cursor=True,
-            style=f"class:mime-{mime.replace('/','-')}",
+            style=_mime_style(mime),
             scrollbar=False,
         )
 
@@ -260,19 +257,48 @@ MIME_ORDER = [
 ]
 
 
-def _calculate_mime_rank(mime_data: tuple[str, Any]) -> int:
-    """Score the richness of mime output types."""
-    mime, data = mime_data
+@lru_cache
+def _match_mime(mime: str, pattern: str) -> bool:
+    """Determine if a mime-type matches a glob pattern."""
+    return PurePath(mime).match(pattern)
+
+
+# Mime types listed explicitly in MIME_ORDER are not matched by any preceding glob
+# pattern, so they can be ranked with a direct look-up
+_MIME_RANKS = {mime: i for i, mime in enumerate(MIME_ORDER) if "*" not in mime}
+
+
+@lru_cache
+def _mime_rank(mime: str) -> int:
+    """Score the richness of a mime type."""
+    if (rank := _MIME_RANKS.get(mime)) is not None:
+        return rank
+    mime_path = PurePath(mime)
     for i, ranked_mime in enumerate(MIME_ORDER):
-        # Uprank plain text with escape sequences
-        if mime == "text/plain" and "\x1b[" in data:
-            i -= 7
-        if PurePath(mime).match(ranked_mime):
+        if mime_path.match(ranked_mime):
             return i
     else:
         return 999
 
 
+def _calculate_mime_rank(mime_data: tuple[str, Any]) -> int:
+    """Score the richness of mime output types."""
+    mime, data = mime_data
+    rank = _mime_rank(mime)
+    # Uprank plain text with escape sequences
+    if mime == "text/plain" and "\x1b[" in data:
+        rank -= 7
+    return rank
+
+
+def _best_mime(data: dict[str, Any]) -> str:
+    """Return the highest ranked mime type in a dictionary of output data."""
+    # Avoid ranking (and scanning) the data if there is nothing to choose from
+    if len(data) == 1:
+        return next(iter(data))
+    return min(data.items(), key=_calculate_mime_rank)[0]
+
+
 class CellOutput:
     """Represent a single cell output.
 
@@ -290,32 +316,51 @@ class CellOutput:
         """
         # Select the first mime-type to render
         self.parent = parent
+        self._raw_data: dict[str, Any] | None = None
+        self._data: dict[str, Any] | None = None
         self.json = json
         self._selected_mime: str | None = None
         self._elements: dict[str, CellOutputElement] = {}
 
+    @property
+    def json(self) -> dict[str, Any]:
+        """Return the cell output's json."""
+        return self._json
+
+    @json.setter
+    def json(self, value: dict[str, Any]) -> None:
+        """Set the cell output's json, clearing the cached output data."""
+        self._json = value
+        self._raw_data = self._data = None
+
     @property
     def selected_mime(self) -> str:
         """Return the selected mime-type, selecting the first by default."""
-        if self._selected_mime is None:
-            self._selected_mime = next(x for x in self.data)
-        return self._selected_mime
+        data = self.raw_data
+        if (mime := self._selected_mime) is None or mime not in data:
+            mime = self._selected_mime = _best_mime(data)
+        return mime
 
     @selected_mime.setter
     def selected_mime(self, value: str) -> None:
         self._selected_mime = value
 
     @property
-    def data(self) -> dict[str, Any]:
-        """Return dictionary of mime types and data for this output.
+    def raw_data(self) -> dict[str, Any]:
+        """Return an unsorted dictionary of mime types and data for this output.
 
         This generates similarly structured data objects for markdown cells and text
         output streams.
 
+        The result is cached until the output's json is replaced or the output is
+        updated.
+
         Returns:
             JSON dictionary mapping mimes type to representation data.
 
         """
+        if self._raw_data is not None:
+            return self._raw_data
         data = {}
         output_type = self.json.get("output_type", "unknown")
         if output_type == "stream":
@@ -327,12 +372,35 @@ class CellOutput:
             data = {"text/x-python-traceback": f"{ename}: {evalue}\n{traceback}"}
         else:
             data = self.json.get("data", {"text/plain": ""})
-        return dict(sorted(data.items(), key=_calculate_mime_rank))
+        self._raw_data = data
+        return data
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Return dictionary of mime types and data for this output, sorted by rank.
+
+        The result is cached until the output's json is replaced or the output is
+        updated.
+
+        Returns:
+            JSON dictionary mapping mimes type to representation data.
+
+        """
+        if self._data is None:
+            data = self.raw_data
+            self._data = (
+                dict(sorted(data.items(), key=_calculate_mime_rank))
+                if len(data) > 1
+                else data
+            )
+        return self._data
 
     def update(self) -> None:
         """Update the output by updating all child containers."""
         # log.debug("Updating %s", self)
-        data = self.data
+        # The output's json may have been modified in place
+        self._raw_data = self._data = None
+        data = self.raw_data
         for mime_type, element in list(self._elements.items()):
             if mime_type in data:
                 element.data = data[mime_type]
@@ -348,9 +416,9 @@ class CellOutput:
         Returns:
             A :class:`OutputElement` container for the currently selected mime-type.
         """
-        data = self.data
+        data = self.raw_data
         for mime_pattern, OutputElement in MIME_RENDERERS.items():
-            if PurePath(mime).match(mime_pattern):
+            if _match_mime(mime, mime_pattern):
                 try:
                     element = OutputElement(
                         mime=mime,
@@ -359,7 +427,7 @@ class CellOutput:
                         parent=self.parent,
                     )
                 except (NotImplementedError, KeyError):
-                    self.selected_mime = mime = list(data.keys())[-1]
+                    self.selected_mime = mime = list(self.data)[-1]
                     continue
                 else:
                     return element
@@ -418,6 +486,7 @@ class CellOutputArea:
         self.style = style
         self.display_json: list[dict[str, Any]] = []
         self.rendered_outputs: list[CellOutput] = []
+        self._streams: dict[str, tuple[dict[str, Any], CellOutput]] = {}
         self.container = HSplit([], style=lambda: self.style)
         self.children = self.container.children
         self.json = json
@@ -430,13 +499,23 @@ class CellOutputArea:
     @json.setter
     def json(self, value: Any) -> None:
         """Set the cell output area JSON data."""
-        # Reset if we have lost existing outputs
-        if any(old_output_json not in value for old_output_json in self._json):
-            self.reset()
-        # Add any new outputs we do not already have
-        for new_output_json in value:
-            if new_output_json not in self._json:
+        old_json = self._json
+        n_old = len(old_json)
+        if len(value) >= n_old and all(
+            old_output_json is new_output_json
+            for old_output_json, new_output_json in zip(old_json, value)
+        ):
+            # Existing outputs are unchanged, so we only need to add the new outputs
+            for new_output_json in value[n_old:]:
                 self.add_output(new_output_json, refresh=False)
+        else:
+            # Reset if we have lost existing outputs
+            if any(old_output_json not in value for old_output_json in old_json):
+                self.reset()
+            # Add any new outputs we do not already have
+            for new_output_json in value:
+                if new_output_json not in self._json:
+                    self.add_output(new_output_json, refresh=False)
         get_app().invalidate()
 
     def add_output(self, output_json: dict[str, Any], refresh: bool = True) -> None:
@@ -444,17 +523,13 @@ class CellOutputArea:
         # Update json
         self._json.append(output_json)
         # Update display json
-        add_output = True
-        if name := output_json.get("name"):
-            for existing_output, rendered_output in zip(
-                self.display_json, self.rendered_outputs
-            ):
-                if name == existing_output.get("name"):
-                    existing_output["text"] += output_json.get("text", "")
-                    rendered_output.update()
-                    add_output = False
-                    break
-        if add_output:
+        name = output_json.get("name")
+        if name and (stream := self._streams.get(name)):
+            # Merge the output into the existing output for this stream
+            existing_output, rendered_output = stream
+            existing_output["text"] += output_json.get("text", "")
+            rendered_output.update()
+        else:
             # Add a copy to the display json so the original does not get modified
             output_json_copy = dict(output_json)
             self.display_json.append(output_json_copy)
@@ -462,6 +537,8 @@ class CellOutputArea:
             output = CellOutput(output_json_copy, self.parent)
             self.rendered_outputs.append(output)
             self.children.append(to_container(output))
+            if name:
+                self._streams[name] = (output_json_copy, output)
         if refresh:
             get_app().invalidate()
 
@@ -476,6 +553,7 @@ class CellOutputArea:
         self._json.clear()
         self.display_json.clear()
         self.rendered_outputs.clear()
+        self._streams.clear()
         self.children.clear()
 
     def scroll_left(self) -> None:
@@ -496,18 +574,21 @@ class CellOutputArea:
         """Convert the contents of the output to plain text."""
         from prompt_toolkit.formatted_text.utils import to_plain_text
 
+        app = get_app()
+        fg = app.color_palette.fg.base_hex
+        bg = app.color_palette.bg.base_hex
+        wrap_lines = app.config.wrap_cell_outputs
         outputs = []
         for cell_output in self.rendered_outputs:
             if isinstance(cell_output.element, CellOutputDataElement):
-                config = get_app().config
                 control = cell_output.element.container.control
                 for line in control.get_lines(
                     control.datum,
                     width=88,
                     height=None,
-                    fg=(cp := get_app().color_palette).fg.base_hex,
-                    bg=cp.bg.base_hex,
-                    wrap_lines=config.wrap_cell_outputs,
+                    fg=fg,
+                    bg=bg,
+                    wrap_lines=wrap_lines,
                 ):
                     outputs.append(to_plain_text(line))
         return "\n".join(outputs)
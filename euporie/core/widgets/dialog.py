@@ -33,6 +33,13 @@ from prompt_toolkit.layout.screen import WritePosition
 from prompt_toolkit.mouse_events import MouseButton, MouseEventType
 from prompt_toolkit.widgets.base import Label
 
+from euporie.core import (
+    __app_name__,
+    __copyright__,
+    __logo__,
+    __strapline__,
+    __version__,
+)
 from euporie.core.app import get_app
 from euporie.core.border import (
     FullLine,
@@ -77,6 +84,17 @@ DialogGrid = (
     + UpperRightHalfLine.top_edge
 )
 
+_ABOUT_TEXT: StyleAndTextTuples = [
+    ("class:logo", __logo__),
+    ("", " "),
+    ("bold", __app_name__),
+    ("", f"Version {__version__}\n\n".rjust(23, " ")),
+    ("", __strapline__.center(30)),
+    ("", "\n"),
+    ("class:hr", "─" * 30 + "\n\n"),
+    ("", __copyright__),
+]
+
 
 class DialogTitleControl(UIControl):
     """A draggable dialog titlebar."""
@@ -190,6 +208,7 @@ class Dialog(Float, metaclass=ABCMeta):
         self.body: AnyContainer = Window()
         self.buttons: dict[str, Callable | None] = {"OK": None}
         self.button_widgets: list[AnyContainer] = []
+        self._button_labels: tuple[str, ...] | None = None
 
         # Create key-bindings
         kb = KeyBindings()
@@ -274,12 +293,23 @@ class Dialog(Float, metaclass=ABCMeta):
     def _load(self, **params: Any) -> None:
         """Load body, create buttons, etc."""
         self.to_focus = None
-        self.buttons_kb = KeyBindings()
 
         # Load body & buttons
         self.load(**params)
 
-        # Create button widgets & callbacks
+        # Re-use the existing button widgets if the buttons have not changed, as the
+        # button handlers look up their callbacks when clicked
+        if (labels := tuple(self.buttons)) != self._button_labels:
+            self._button_labels = labels
+            self._load_buttons()
+
+        # Focus first button by default if nothing else was specified by ``self.load()``
+        if self.to_focus is None:
+            self.to_focus = self.button_widgets[0]
+
+    def _load_buttons(self) -> None:
+        """Create button widgets & callbacks."""
+        self.buttons_kb = KeyBindings()
         self.button_widgets.clear()
 
         if self.buttons:
@@ -317,10 +347,6 @@ class Dialog(Float, metaclass=ABCMeta):
             self.buttons_kb.add("left", filter=~first_selected)(focus_previous)
             self.buttons_kb.add("right", filter=~last_selected)(focus_next)
 
-        # Focus first button by default if nothing else was specified by ``self.load()``
-        if self.to_focus is None:
-            self.to_focus = self.button_widgets[0]
-
     @abstractmethod
     def load(self) -> None:
         """Load the dialog's body etc."""
@@ -371,33 +397,17 @@ class AboutDialog(Dialog):
 
     title = "About"
 
-    def load(self) -> None:
-        """Load the dialog's body."""
-        from euporie.core import (
-            __app_name__,
-            __copyright__,
-            __logo__,
-            __strapline__,
-            __version__,
-        )
-
+    def __init__(self, app: BaseApp) -> None:
+        """Create the dialog's body, which never changes."""
+        super().__init__(app)
         self.body = Window(
-            FormattedTextControl(
-                [
-                    ("class:logo", __logo__),
-                    ("", " "),
-                    ("bold", __app_name__),
-                    ("", f"Version {__version__}\n\n".rjust(23, " ")),
-                    ("", __strapline__.center(30)),
-                    ("", "\n"),
-                    ("class:hr", "─" * 30 + "\n\n"),
-                    ("", __copyright__),
-                    # ("", "\n"),
-                ]
-            ),
+            FormattedTextControl(_ABOUT_TEXT),
             dont_extend_height=True,
         )
 
+    def load(self) -> None:
+        """Load the dialog's body (the body is static, so nothing to do)."""
+
     # ################################### Commands ####################################
 
     @staticmethod
@@ -619,8 +629,9 @@ class NoKernelsDialog(Dialog):
 
     title = "No Kernels Found"
 
-    def load(self) -> None:
-        """Load the dialog body."""
+    def __init__(self, app: BaseApp) -> None:
+        """Create the dialog's body, which never changes."""
+        super().__init__(app)
         self.body = Window(
             FormattedTextControl(
                 [
@@ -640,6 +651,9 @@ class NoKernelsDialog(Dialog):
             )
         )
 
+    def load(self) -> None:
+        """Load the dialog body (the body is static, so nothing to do)."""
+
 
 class SelectKernelDialog(Dialog):
     """A dialog which allows the user to select a kernel."""
@@ -881,20 +895,20 @@ class ShortcutsDialog(Dialog):
         from euporie.core.margins import MarginContainer, ScrollbarMargin
         from euporie.core.widgets.formatted_text_area import FormattedTextArea
 
+        # The key-binding details and their width only need calculating once, so the
+        # body can be re-used each time the dialog is shown
         if not self.details:
-            self.details = self.format_key_info()
-        assert self.details is not None
-
-        width = max_line_width(self.details)
-
-        fta = FormattedTextArea(
-            formatted_text=self.details,
-            multiline=True,
-            focusable=True,
-            wrap_lines=False,
-            width=width - 2,
-        )
-        self.body = VSplit([fta, MarginContainer(ScrollbarMargin(), target=fta.window)])
+            self.details = details = self.format_key_info()
+            fta = FormattedTextArea(
+                formatted_text=details,
+                multiline=True,
+                focusable=True,
+                wrap_lines=False,
+                width=max_line_width(details) - 2,
+            )
+            self.body = VSplit(
+                [fta, MarginContainer(ScrollbarMargin(), target=fta.window)]
+            )
 
     def format_key_info(self) -> StyleAndTextTuples:
         """Generate a table with the current key bindings."""
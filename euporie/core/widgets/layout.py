@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import sys
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_right
 from functools import partial
 from typing import TYPE_CHECKING, NamedTuple, cast
 
@@ -26,7 +28,7 @@ from prompt_toolkit.layout.controls import (
 from prompt_toolkit.layout.dimension import Dimension as D
 from prompt_toolkit.layout.dimension import to_dimension
 from prompt_toolkit.mouse_events import MouseButton, MouseEventType
-from prompt_toolkit.utils import Event
+from prompt_toolkit.utils import Event, get_cwidth
 
 from euporie.core.border import OutsetGrid
 from euporie.core.data_structures import DiBool
@@ -35,7 +37,7 @@ from euporie.core.layout.containers import HSplit, VSplit, Window
 from euporie.core.widgets.decor import Border
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Sequence
+    from typing import Any, Callable, ClassVar, Sequence
 
     from prompt_toolkit.filters import FilterOrBool
     from prompt_toolkit.formatted_text.base import AnyFormattedText, StyleAndTextTuples
@@ -140,7 +142,9 @@ class ConditionalSplit:
         self.vertical = to_filter(vertical)
         self.args = args
         self.kwargs = kwargs
-        self._cache: SimpleCache = SimpleCache(maxsize=2)
+        # The horizontal and vertical containers, created when first needed
+        self._containers: list[_Split | None] = [None, None]
+        self._dynamic_container = DynamicContainer(self.container)
 
     def load_container(self, vertical: bool) -> _Split:
         """Load the container."""
@@ -152,11 +156,13 @@ class ConditionalSplit:
     def container(self) -> _Split:
         """Return the container for the current orientation."""
         vertical = self.vertical()
-        return self._cache.get(vertical, partial(self.load_container, vertical))
+        if (container := self._containers[vertical]) is None:
+            container = self._containers[vertical] = self.load_container(vertical)
+        return container
 
     def __pt_container__(self) -> AnyContainer:
-        """Return a dymanic container."""
-        return DynamicContainer(self.container)
+        """Return a dynamic container."""
+        return self._dynamic_container
 
 
 class ReferencedSplit:
@@ -209,12 +215,38 @@ class TabBarTab(NamedTuple):
 class TabBarControl(UIControl):
     """A control which shows a tab bar."""
 
+    # Performance notes: rendering is dominated by building strings and fragment
+    # lists rather than by numeric work, so it is kept in pure Python and relies on
+    # caching instead:
+    # - rendered content is cached by tabs version (or hash), width, closeability
+    #   and active index, along with the mouse handler regions;
+    # - styled titles and their widths are cached by title text and active state;
+    # - each tab emits a fixed number of fragments (plus one per title fragment),
+    #   and each gap between tabs emits a single spacer fragment.
+
     char_bottom = "▁"
     char_left = "▏"
     char_right = "▕"
     char_top = "▁"
     char_close = "✖"
 
+    # Fragment styles for each part of active and inactive tabs. These are interned
+    # so equal styles share an identity in the renderer's style caches
+    _styles: ClassVar[dict[tuple[bool, str], str]] = {
+        (active, part): sys.intern(
+            f"class:{'active' if active else 'inactive'} {style}"
+        )
+        for active in (True, False)
+        for part, style in {
+            "tab": "class:tab",
+            "top": "class:tab,border,top",
+            "left": "class:tab,border,left",
+            "right": "class:tab,border,right",
+            "title": "class:tab,title",
+            "close": "class:tab,close",
+        }.items()
+    }
+
     def __init__(
         self,
         tabs: Sequence[TabBarTab] | Callable[[], Sequence[TabBarTab]],
@@ -235,15 +267,19 @@ class TabBarControl(UIControl):
 
         """
         self._tabs = tabs
+        self._tabs_version = 0
         self.spacing = spacing
         self.closeable = closeable
         self.max_title_width = max_title_width
         self._active = active
 
-        self.mouse_handlers: dict[int, Callable[..., Any] | None] = {}
+        # The start column and mouse handler of each region of the tab-bar
+        self._regions: tuple[list[int], list[Callable[..., Any] | None]] = ([], [])
 
-        self._title_cache: SimpleCache = SimpleCache(maxsize=1)
-        self._content_cache: SimpleCache = SimpleCache(maxsize=50)
+        self._title_cache: SimpleCache[
+            tuple[str, int, bool], tuple[StyleAndTextTuples, int]
+        ] = SimpleCache(maxsize=50)
+        self._content_cache: SimpleCache = SimpleCache(maxsize=8)
 
     @property
     def tabs(self) -> list[TabBarTab]:
@@ -257,6 +293,7 @@ class TabBarControl(UIControl):
     def tabs(self, tabs: Sequence[TabBarTab]) -> None:
         """Set the tab bar's current tabs."""
         self._tabs = tabs
+        self._tabs_version += 1
 
     @property
     def active(self) -> int:
@@ -292,87 +329,138 @@ class TabBarControl(UIControl):
     def create_content(self, width: int, height: int) -> UIContent:
         """Generate the formatted text fragments which make the controls output."""
 
-        def get_content() -> UIContent:
+        def get_content() -> tuple[
+            UIContent, tuple[list[int], list[Callable[..., Any] | None]]
+        ]:
             fragment_lines = self.render(width)
 
-            return UIContent(
-                get_line=lambda i: fragment_lines[i],
-                line_count=len(fragment_lines),
-                show_cursor=False,
+            return (
+                UIContent(
+                    get_line=lambda i: fragment_lines[i],
+                    line_count=len(fragment_lines),
+                    show_cursor=False,
+                ),
+                self._regions,
+            )
+
+        # Tabs returned by a callable may change at any time, so must be hashed
+        tabs_key = (
+            hash(tuple(self._tabs())) if callable(self._tabs) else self._tabs_version
+        )
+        key = (tabs_key, width, self.closeable, self.active)
+        # Restore the mouse handler regions along with the cached content
+        content, self._regions = self._content_cache.get(key, get_content)
+        return content
+
+    def _format_title(
+        self, title: AnyFormattedText, is_active: bool
+    ) -> tuple[StyleAndTextTuples, int]:
+        """Return a tab's truncated and styled title fragments, and their width."""
+        # Resolve callable titles so the formatted result can be cached
+        if callable(title):
+            title = title()
+
+        def _format() -> tuple[StyleAndTextTuples, int]:
+            title_ft: StyleAndTextTuples
+            # Plain single-line titles which fit do not need parsing or truncating
+            if (
+                isinstance(title, str)
+                and "\n" not in title
+                and (width := get_cwidth(title)) <= self.max_title_width
+            ):
+                title_ft = [("", title)]
+            else:
+                title_ft = truncate(to_formatted_text(title), self.max_title_width)
+                width = fragment_list_width(title_ft)
+            title_style = self._styles[is_active, "title"] + " "
+            return (
+                [
+                    (sys.intern(title_style + frag_style), text)
+                    for frag_style, text, *_ in title_ft
+                ],
+                width,
             )
 
-        key = (hash(tuple(self.tabs)), width, self.closeable, self.active)
-        return self._content_cache.get(key, get_content)
+        if isinstance(title, str):
+            return self._title_cache.get(
+                (title, self.max_title_width, is_active), _format
+            )
+        return _format()
 
     def render(self, width: int) -> list[StyleAndTextTuples]:
-        """Render the tab-bar as linest of formatted text."""
+        """Render the tab-bar as lines of formatted text."""
         top_line: StyleAndTextTuples = []
         tab_line: StyleAndTextTuples = []
-        i = 0
+        region_starts: list[int] = [0]
+        region_handlers: list[Callable[..., Any] | None] = [None]
+        spacing = self.spacing
+        top_spacing = ("", " " * spacing)
+        bottom_spacing = ("class:border,bottom", self.char_bottom * spacing)
+        char_top = self.char_top
+        close_top = char_top * 2
+        styles = self._styles
+        active = self.active
 
         # Initial spacing
-        for _ in range(self.spacing):
-            top_line += [("", " ")]
-            tab_line += [("class:border,bottom", self.char_bottom)]
-        i += self.spacing
+        top_line.append(top_spacing)
+        tab_line.append(bottom_spacing)
+        i = spacing
 
         for j, tab in enumerate(self.tabs):
-            title_ft = truncate(to_formatted_text(tab.title), self.max_title_width)
-            title_width = fragment_list_width(title_ft)
-            style = "class:active" if self.active == j else "class:inactive"
+            is_active = active == j
+            title_ft, title_width = self._format_title(tab.title, is_active)
 
             # Add top edge over title
-            top_line += [
-                (f"{style} class:tab,border,top", self.char_top * (title_width + 2))
-            ]
+            top_style = styles[is_active, "top"]
+            top_line.append((top_style, char_top * (title_width + 2)))
 
             # Left edge
-            tab_line += [(f"{style} class:tab,border,left", self.char_left)]
-            self.mouse_handlers[i] = tab.on_activate
+            tab_line.append((styles[is_active, "left"], self.char_left))
+            region_starts.append(i)
+            region_handlers.append(tab.on_activate)
             i += 1
 
             # Title
-            tab_line += [
-                (f"{style} class:tab,title {frag_style}", text)
-                for frag_style, text, *_ in title_ft
-            ]
-            for _ in range(title_width):
-                self.mouse_handlers[i] = tab.on_activate
-                i += 1
+            tab_line.extend(title_ft)
+            i += title_width
 
             # Close button
             if self.closeable:
-                top_line += [(f"{style} class:tab,border,top", self.char_top * 2)]
-                self.mouse_handlers[i] = tab.on_activate
+                top_line.append((top_style, close_top))
                 i += 1
-                tab_line += [
-                    (f"{style} class:tab", " "),
-                    (f"{style} class:tab,close", self.char_close),
-                ]
-                self.mouse_handlers[i] = tab.on_close
+                tab_line.append((styles[is_active, "tab"], " "))
+                tab_line.append((styles[is_active, "close"], self.char_close))
+                region_starts.append(i)
+                region_handlers.append(tab.on_close)
                 i += 1
 
             # Right edge
-            tab_line += [(f"{style} class:tab,border,right", self.char_right)]
-            self.mouse_handlers[i] = tab.on_activate
+            tab_line.append((styles[is_active, "right"], self.char_right))
+            region_starts.append(i)
+            region_handlers.append(tab.on_activate)
             i += 1
 
             # Spacing
-            for _ in range(self.spacing):
-                top_line += [("", " ")]
-                tab_line += [("class:border,bottom", self.char_bottom)]
-                i += 1
+            top_line.append(top_spacing)
+            tab_line.append(bottom_spacing)
+            region_starts.append(i)
+            region_handlers.append(None)
+            i += spacing
 
         # Add border to fill width
-        tab_line += [
-            (
-                "class:border,bottom",
-                self.char_bottom * (width - fragment_list_width(tab_line)),
-            )
-        ]
+        tab_line.append(("class:border,bottom", self.char_bottom * (width - i)))
+
+        self._regions = (region_starts, region_handlers)
 
         return [top_line, tab_line]
 
+    def handler_at(self, col: int) -> Callable[..., Any] | None:
+        """Return the mouse handler for the region of the tab-bar at a column."""
+        starts, handlers = self._regions
+        if (index := bisect_right(starts, col) - 1) >= 0:
+            return handlers[index]
+        return None
+
     def mouse_handler(self, mouse_event: MouseEvent) -> NotImplementedOrNone:
         """Handle mouse events."""
         row = mouse_event.position.y
@@ -380,35 +468,37 @@ class TabBarControl(UIControl):
 
         if row == 1 and mouse_event.event_type == MouseEventType.MOUSE_UP:
             if mouse_event.button == MouseButton.LEFT and callable(
-                handler := self.mouse_handlers.get(col)
+                handler := self.handler_at(col)
             ):
                 # Activate the tab
                 handler()
                 return None
             elif mouse_event.button == MouseButton.MIDDLE and self.closeable:
-                if callable(handler := self.mouse_handlers.get(col)):
+                if callable(handler := self.handler_at(col)):
                     # Activate tab
                     handler()
                     # Close the now active tab
                     tabs = self.tabs
-                    on_close = tabs[self.active]
+                    on_close = tabs[self.active].on_close
                     if callable(on_close):
                         on_close()
                 return None
 
-        tabs = self.tabs
-        if mouse_event.event_type == MouseEventType.SCROLL_UP:
-            index = max(self.active - 1, 0)
-            if index != self.active:
-                if callable(deactivate := tabs[self.active].on_deactivate):
-                    deactivate()
-                if callable(activate := tabs[index].on_activate):
-                    activate()
-                return None
-        elif mouse_event.event_type == MouseEventType.SCROLL_DOWN:
-            index = min(self.active + 1, len(tabs) - 1)
-            if index != self.active:
-                if callable(deactivate := tabs[self.active].on_deactivate):
+        if mouse_event.event_type in (
+            MouseEventType.SCROLL_UP,
+            MouseEventType.SCROLL_DOWN,
+        ):
+            tabs = self.tabs
+            active = self.active
+            if mouse_event.event_type == MouseEventType.SCROLL_UP:
+                index = max(active - 1, 0)
+            else:
+                index = min(active + 1, len(tabs) - 1)
+            if index != active and 0 <= index < len(tabs):
+                # The active index may be stale, e.g. just after the last tab closes
+                if 0 <= active < len(tabs) and callable(
+                    deactivate := tabs[active].on_deactivate
+                ):
                     deactivate()
                 if callable(activate := tabs[index].on_activate):
                     activate()
@@ -460,6 +550,15 @@ class StackedSplit(metaclass=ABCMeta):
         base_style = self.style() if callable(self.style) else self.style
         return f"{base_style} {style}"
 
+    def with_style(self, style: str) -> str | Callable[[], str]:
+        """Return a style for a part of the widget, added to the widget's base style.
+
+        If the base style is static, the combined style is resolved immediately.
+        """
+        if callable(self.style):
+            return partial(self.add_style, style)
+        return f"{self.style} {style}"
+
     @property
     def active(self) -> int | None:
         """Return the index of the active child container."""
@@ -472,11 +571,14 @@ class StackedSplit(metaclass=ABCMeta):
         Args:
             value: The index of the tab to make active
         """
+        if value == self._active:
+            return
         if value is not None:
             value = max(0, min(value, len(self.children)))
         if value != self._active:
+            # The container reads the active index when rendered, so does not need
+            # to be refreshed
             self._active = value
-            self.refresh()
             self.on_change.fire()
             if value is not None:
                 try:
@@ -536,6 +638,7 @@ class TabbedSplit(StackedSplit):
         """Initialize a new tabbed container."""
         self.border = border
         self.show_borders = show_borders or DiBool(False, True, True, True)
+        self._activators: list[Callable[[], None]] = []
         super().__init__(
             children=children,
             titles=titles,
@@ -555,12 +658,12 @@ class TabbedSplit(StackedSplit):
         Returns:
             The widget's container
         """
-        self.control = TabBarControl(self.load_tabs(), active=self.active or 0)
+        self.control = TabBarControl(self.load_tabs(), active=lambda: self.active or 0)
         return HSplit(
             [
                 Window(
                     self.control,
-                    style=partial(self.add_style, "class:tab-bar"),
+                    style=self.with_style("class:tab-bar"),
                     height=2,
                 ),
                 Border(
@@ -581,81 +684,98 @@ class TabbedSplit(StackedSplit):
         )
 
     def refresh(self) -> None:
-        """Refresh the widget - set the tab-bar's tabs and active tab index."""
-        self.control.tabs = self.load_tabs()
-        if self.active is not None:
-            self.control.active = self.active
+        """Refresh the widget - set the tab-bar's tabs if they have changed."""
+        if (tabs := self.load_tabs()) != self.control.tabs:
+            self.control.tabs = tabs
 
     def load_tabs(self) -> list[TabBarTab]:
         """Return a list of tabs for the current children."""
+        # Re-use the tab activation callbacks between refreshes
+        activators = self._activators
+        titles = self.titles
+        for i in range(len(activators), len(titles)):
+            activators.append(partial(setattr, self, "active", i))
         return [
-            TabBarTab(
-                title=title,
-                on_activate=partial(setattr, self, "active", i),
-            )
-            for i, title in enumerate(self.titles)
+            TabBarTab(title=title, on_activate=activator)
+            for title, activator in zip(titles, activators)
         ]
 
 
 class AccordionSplit(StackedSplit):
     """A container which switches between children using expandable sections."""
 
+    # Title styles and arrows for collapsed and expanded sections
+    title_styles = ("bold", "bold class:selection")
+    title_arrows = ("▼", "▶")
+
     def load_container(self) -> AnyContainer:
-        """Create the accordiion widget's container."""
+        """Create the accordion widget's container."""
+        self._row_children: list[AnyContainer] = []
+        self._mouse_handlers: list[Callable[[MouseEvent], None]] = []
+        self._container = HSplit([], style="class:accordion")
         self.draw_container()
-        return DynamicContainer(lambda: self._container)
+        return self._container
 
     def draw_container(self) -> None:
-        """Render the accordion in it's current state."""
-        self._container = HSplit(
-            [
-                Border(
-                    HSplit(
-                        [
-                            Window(
-                                FormattedTextControl(
-                                    partial(self.title_text, index, title),
-                                    focusable=True,
-                                    show_cursor=False,
-                                )
-                            ),
-                            ConditionalContainer(
-                                Box(child, padding_left=0),
-                                filter=Condition(
-                                    partial(lambda i: self.active == i, index)
-                                ),
-                            ),
-                        ]
-                    ),
-                    style=partial(self.add_style, "class:border"),
-                )
-                for index, (title, child) in enumerate(zip(self.titles, self.children))
-            ],
-            style="class:accordion",
+        """Update the accordion's sections to match its children and titles.
+
+        Sections are only re-created when the child container they display changes.
+        """
+        rows = self._container.children
+        row_children = self._row_children
+        count = min(len(self.titles), len(self.children))
+        del rows[count:], row_children[count:]
+        for index in range(len(self._mouse_handlers), count):
+            self._mouse_handlers.append(
+                cast("Callable[[MouseEvent], None]", partial(self.mouse_handler, index))
+            )
+        for index, child in enumerate(self.children[:count]):
+            if index < len(row_children):
+                if row_children[index] is not child:
+                    rows[index] = self.load_row(index, child)
+                    row_children[index] = child
+            else:
+                rows.append(self.load_row(index, child))
+                row_children.append(child)
+
+    def load_row(self, index: int, child: AnyContainer) -> Container:
+        """Create the section of the accordion displaying a child container."""
+        return to_container(
+            Border(
+                HSplit(
+                    [
+                        Window(
+                            FormattedTextControl(
+                                partial(self.title_text, index),
+                                focusable=True,
+                                show_cursor=False,
+                            )
+                        ),
+                        ConditionalContainer(
+                            Box(child, padding_left=0),
+                            filter=Condition(partial(self.is_active, index)),
+                        ),
+                    ]
+                ),
+                style=self.with_style("class:border"),
+            )
         )
 
-    def title_text(self, index: int, title: AnyFormattedText) -> StyleAndTextTuples:
+    def is_active(self, index: int) -> bool:
+        """Determine if the child container at an index is expanded."""
+        return self._active == index
+
+    def title_text(self, index: int) -> StyleAndTextTuples:
         """Generate the title for each child container."""
+        handler = self._mouse_handlers[index]
+        is_active = self._active == index
         return [
             ("", " "),
-            (
-                "bold" + (" class:selection" if self.active == index else ""),
-                "▶" if self.active == index else "▼",
-                cast(
-                    "Callable[[MouseEvent], None]", partial(self.mouse_handler, index)
-                ),
-            ),
+            (self.title_styles[is_active], self.title_arrows[is_active], handler),
             ("", " "),
             *[
-                (
-                    f"bold {style}",
-                    text,
-                    cast(
-                        "Callable[[MouseEvent], None]",
-                        partial(self.mouse_handler, index),
-                    ),
-                )
-                for style, text, *_ in to_formatted_text(title)
+                (f"bold {style}", text, handler)
+                for style, text, *_ in to_formatted_text(self.titles[index])
             ],
         ]
 
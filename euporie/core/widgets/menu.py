@@ -79,7 +79,7 @@ class MenuItem:
         description: str = "",
         separator: bool = False,
         handler: Callable[[], None] | None = None,
-        children: list[MenuItem] | None = None,
+        children: Sequence[MenuItem] | Callable[[], Sequence[MenuItem]] | None = None,
         shortcut: AnyFormattedText = "",
         hidden: FilterOrBool = False,
         disabled: FilterOrBool = False,
@@ -95,7 +95,8 @@ class MenuItem:
             description: More information about what the menu item does
             separator: If True, this menu item is treated as a separator
             handler: As per `prompt_toolkit.widgets.menus.MenuItem`
-            children: As per `prompt_toolkit.widgets.menus.MenuItem`
+            children: As per `prompt_toolkit.widgets.menus.MenuItem`, or a callable
+                which returns the children, which is called when they are first needed
             shortcut: As per `prompt_toolkit.widgets.menus.MenuItem`
             hidden: The handler will be hidden when this filter is True
             disabled: The handler will be disabled when this filter is True
@@ -118,10 +119,17 @@ class MenuItem:
         self._prefix_width: int | None = None
 
         self.handler = handler
-        self.children = children or []
+        self._children = children or ()
         self.shortcut = shortcut
         self.selected_item = 0
 
+    @property
+    def children(self) -> Sequence[MenuItem]:
+        """Return the item's child menu items, creating them if needed."""
+        if callable(children := self._children):
+            self._children = children = children()
+        return children
+
     @property
     def formatted_text(self) -> StyleAndTextTuples:
         """Generate the formatted text for this menu item."""
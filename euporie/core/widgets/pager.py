@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from pathlib import PurePath
 from typing import TYPE_CHECKING, NamedTuple
 
 from prompt_toolkit.filters import Condition
@@ -15,9 +14,7 @@ from prompt_toolkit.layout.dimension import Dimension
 
 from euporie.core.commands import add_cmd
 from euporie.core.convert.datum import Datum
-from euporie.core.convert.formats import BASE64_FORMATS
-from euporie.core.convert.mime import MIME_FORMATS
-from euporie.core.convert.registry import find_route
+from euporie.core.convert.mime import get_display_format
 from euporie.core.current import get_app
 from euporie.core.filters import pager_has_focus
 from euporie.core.key_binding.registry import (
@@ -68,15 +65,7 @@ class PagerOutputDataElement(CellOutputDataElement):
             parent: The parent container the output-element is attached to
         """
         # Get internal format
-        format_ = "ansi"
-        mime_path = PurePath(mime)
-        for mime_type, data_format in MIME_FORMATS.items():
-            if mime_path.match(mime_type):
-                if data_format in BASE64_FORMATS:
-                    data_format = f"base64-{data_format}"
-                if find_route(data_format, "ft") is not None:
-                    format_ = data_format
-                    break
+        format_ = get_display_format(mime)
 
         self._datum = Datum(data, format_)
         self.container = Display(
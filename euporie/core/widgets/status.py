@@ -84,15 +84,11 @@ class StatusBar:
             content=VSplit(
                 [
                     Window(
-                        FormattedTextControl(
-                            lambda: self._status_cache[get_app().render_counter,][0]
-                        ),
+                        FormattedTextControl(self.status_left),
                         style="class:status",
                     ),
                     Window(
-                        FormattedTextControl(
-                            lambda: self._status_cache[get_app().render_counter,][1]
-                        ),
+                        FormattedTextControl(self.status_right),
                         style="class:status.right",
                         align=WindowAlign.RIGHT,
                     ),
@@ -104,6 +100,14 @@ class StatusBar:
             & to_filter(extra_filter),
         )
 
+    def status_left(self) -> StyleAndTextTuples:
+        """Return the formatted left-hand status bar fields."""
+        return self._status_cache[get_app().render_counter,][0]
+
+    def status_right(self) -> StyleAndTextTuples:
+        """Return the formatted right-hand status bar fields."""
+        return self._status_cache[get_app().render_counter,][1]
+
     def _status(self, render_counter: int = 0) -> list[StyleAndTextTuples]:
         """Load and format the current status bar entries."""
         layout = get_app().layout
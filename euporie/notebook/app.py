@@ -7,6 +7,7 @@ import logging
 from functools import partial
 from typing import TYPE_CHECKING, cast
 
+from prompt_toolkit.cache import SimpleCache
 from prompt_toolkit.filters import Condition
 from prompt_toolkit.formatted_text.base import to_formatted_text
 from prompt_toolkit.layout.containers import (
@@ -23,6 +24,7 @@ from euporie.core import __logo__
 from euporie.core.app import BaseApp
 from euporie.core.commands import add_cmd, get_cmd
 from euporie.core.config import add_setting
+from euporie.core.filters import has_multiple_tabs, has_tabs
 from euporie.core.ft.utils import truncate
 from euporie.core.key_binding.registry import register_bindings
 from euporie.core.layout.containers import HSplit, VSplit, Window
@@ -52,13 +54,12 @@ from euporie.notebook.widgets.side_bar import SideBar
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
-    from typing import Any, Callable, Sequence
+    from typing import Any, Sequence
 
     from prompt_toolkit.application.application import Application
     from prompt_toolkit.formatted_text import StyleAndTextTuples
     from prompt_toolkit.layout.containers import AnyContainer, Float
 
-    from euporie.core.tabs.base import Tab
     from euporie.core.widgets.cell import Cell
     from euporie.core.widgets.status import StatusBarFields
 
@@ -87,6 +88,10 @@ class NotebookApp(BaseApp):
         # Register config hooks
         self.config.get_item("show_cell_borders").event += lambda x: self.refresh()
 
+        # Cache formatted text for the title bar and the default status-bar fields
+        self._title_cache: SimpleCache[str, StyleAndTextTuples] = SimpleCache(maxsize=1)
+        self._default_statusbar_fields: StatusBarFields | None = None
+
     async def _poll_terminal_colors(self) -> None:
         """Repeatedly query the terminal for its background and foreground colours."""
         while self.config.terminal_polling_interval:
@@ -108,9 +113,17 @@ class NotebookApp(BaseApp):
 
     def format_title(self) -> StyleAndTextTuples:
         """Format the tab's title for display in the top right of the app."""
-        if self.tab:
-            title = truncate(to_formatted_text(self.tab.title, style="bold"), 30)
-            return [("", " "), *title, ("", " ")]
+        if tab := self.tab:
+            title = tab.title
+
+            def _format_title() -> StyleAndTextTuples:
+                return [
+                    ("", " "),
+                    *truncate(to_formatted_text(title, style="bold"), 30),
+                    ("", " "),
+                ]
+
+            return self._title_cache.get(title, _format_title)
         else:
             return []
 
@@ -145,26 +158,32 @@ class NotebookApp(BaseApp):
 
     def _statusbar_defaults(self) -> StatusBarFields | None:
         """Load the default statusbar fields (run after keybindings are loaded)."""
-        return (
-            [
+        if self._default_statusbar_fields is None:
+            self._default_statusbar_fields = (
                 [
-                    ("", "Press "),
-                    ("bold", get_cmd("new-notebook").key_str()),
-                    ("", " to start a new notebook"),
+                    [
+                        ("", "Press "),
+                        ("bold", get_cmd("new-notebook").key_str()),
+                        ("", " to start a new notebook"),
+                    ],
                 ],
-            ],
-            [[("", "Press "), ("bold", get_cmd("quit").key_str()), ("", " to quit")]],
-        )
+                [
+                    [
+                        ("", "Press "),
+                        ("bold", get_cmd("quit").key_str()),
+                        ("", " to quit"),
+                    ]
+                ],
+            )
+        return self._default_statusbar_fields
 
     def load_container(self) -> FloatContainer:
         """Build the main application layout."""
-        have_tabs = Condition(lambda: bool(self.tabs))
-
         self.logo = StatusContainer(
             body=Window(
                 FormattedTextControl(
                     [("", f" {__logo__} ")],
-                    focusable=~have_tabs,
+                    focusable=~has_tabs,
                     show_cursor=False,
                     style="class:menu,logo",
                 ),
@@ -183,7 +202,7 @@ class NotebookApp(BaseApp):
                 dont_extend_width=True,
                 align=WindowAlign.RIGHT,
             ),
-            filter=have_tabs,
+            filter=has_tabs,
         )
 
         self.tab_bar_control = TabBarControl(
@@ -198,10 +217,8 @@ class NotebookApp(BaseApp):
                 style="class:app-tab-bar",
                 dont_extend_height=True,
             ),
-            filter=Condition(
-                lambda: (len(self.tabs) > 1 or self.config.always_show_tab_bar)
-                and TabMode(self.config.tab_mode) == TabMode.STACK
-            ),
+            filter=(has_multiple_tabs | self.config.filter("always_show_tab_bar"))
+            & Condition(lambda: TabMode(self.config.tab_mode) == TabMode.STACK),
         )
 
         self.pager = Pager()
@@ -297,9 +314,9 @@ class NotebookApp(BaseApp):
     def exit(self, *args: Any, **kwargs: Any) -> None:
         """Check for unsaved files before closing.
 
-        Creates a chain of close file commands, where the callback for each triggers
-        the closure of the next. The closing process can be cancelled anywhere along
-        the chain.
+        Closes each tab in turn, where the callback for each closure triggers the
+        closure of the next. The closing process can be cancelled anywhere along the
+        chain.
 
         Args:
             args: Positional arguments
@@ -307,40 +324,17 @@ class NotebookApp(BaseApp):
 
         """
         really_close = super().exit
-        if self.tabs:
-
-            def final_cb() -> None:
-                """Really exit after the last tab in the chain is closed."""
-                self.cleanup_closed_tab(self.tabs[0])
-                really_close(*args, **kwargs)
-
-            def create_cb(close_tab: Tab, cleanup_tab: Tab, cb: Callable) -> Callable:
-                """Generate a tab close chaining callbacks.
-
-                Cleans up after the previously closed tab, and requests to close the
-                next tab in the chain.
+        if tabs := list(self.tabs):
 
-                Args:
-                    close_tab: The tab to close
-                    cleanup_tab: The previously closed tab to cleanup
-                    cb: The callback to call when work is complete
+            def close_next() -> None:
+                """Clean up the last closed tab and close the next one."""
+                self.cleanup_closed_tab(tabs.pop())
+                if tabs:
+                    tabs[-1].close(cb=close_next)
+                else:
+                    really_close(*args, **kwargs)
 
-                Returns:
-                    A callback function which cleans up `cleanup_tab` and closes
-                        `close_tab`.
-
-                """
-
-                def inner() -> None:
-                    self.cleanup_closed_tab(cleanup_tab)
-                    close_tab.close(cb=cb)
-
-                return inner
-
-            cb = final_cb
-            for close_tab, cleanup_tab in zip(self.tabs, self.tabs[1:]):
-                cb = create_cb(close_tab, cleanup_tab, cb)
-            self.tabs[-1].close(cb)
+            tabs[-1].close(cb=close_next)
         else:
             really_close(*args, **kwargs)
 
@@ -358,13 +352,13 @@ class NotebookApp(BaseApp):
             return self.tab.cell
         return None
 
-    def load_menu_items(self) -> list[MenuItem]:
+    def load_menu_items(self) -> tuple[MenuItem, ...]:
         """Load the list of menu items to display in the menu."""
         separator = MenuItem(separator=True)
-        return [
+        return (
             MenuItem(
                 "File",
-                children=[
+                children=(
                     get_cmd("new-notebook").menu,
                     get_cmd("open-file").menu,
                     separator,
@@ -373,12 +367,12 @@ class NotebookApp(BaseApp):
                     get_cmd("close-tab").menu,
                     separator,
                     get_cmd("quit").menu,
-                ],
+                ),
                 description="File management",
             ),
             MenuItem(
                 "Edit",
-                children=[
+                children=(
                     get_cmd("undelete-cells").menu,
                     separator,
                     get_cmd("cut-cells").menu,
@@ -392,48 +386,48 @@ class NotebookApp(BaseApp):
                     separator,
                     get_cmd("reformat-cells").menu,
                     get_cmd("reformat-notebook").menu,
-                ],
+                ),
                 description="Make changes to the current file",
             ),
             MenuItem(
                 "Run",
-                children=[
+                children=(
                     get_cmd("run-selected-cells").menu,
                     get_cmd("run-all-cells").menu,
-                ],
+                ),
                 description="Run notebook cells",
             ),
             MenuItem(
                 "Kernel",
-                children=[
+                children=(
                     get_cmd("interrupt-kernel").menu,
                     get_cmd("restart-kernel").menu,
                     get_cmd("change-kernel").menu,
-                ],
+                ),
                 description="Manage the current notebook's kernel",
             ),
             MenuItem(
                 "Tabs",
-                children=[
+                children=(
                     get_cmd("next-tab").menu,
                     get_cmd("previous-tab").menu,
                     separator,
                     MenuItem(
                         "Tab mode",
-                        children=[
+                        children=tuple(
                             get_cmd(f"set-tab-mode-{choice}").menu
                             for choice in self.config.get_item("tab_mode").choices
-                        ],
+                        ),
                     ),
-                ],
+                ),
                 description="Tab management",
             ),
             MenuItem(
                 "Settings",
-                children=[
+                children=(
                     MenuItem(
                         "UI Elements",
-                        children=[
+                        children=(
                             get_cmd("switch-background-pattern").menu,
                             get_cmd("toggle-show-cell-borders").menu,
                             get_cmd("toggle-always-show-tab-bar").menu,
@@ -441,7 +435,7 @@ class NotebookApp(BaseApp):
                             get_cmd("toggle-show-status-bar").menu,
                             get_cmd("toggle-show-scroll-bar").menu,
                             get_cmd("toggle-multiplexer-passthrough").menu,
-                        ],
+                        ),
                         description="Turn elements of euporie's interface on or off",
                     ),
                     self.config.get_item("color_scheme").menu,
@@ -454,23 +448,23 @@ class NotebookApp(BaseApp):
                     separator,
                     MenuItem(
                         "Code tools",
-                        children=[
+                        children=(
                             get_cmd("toggle-enable-language-servers").menu,
                             separator,
                             get_cmd("toggle-autoformat").menu,
                             get_cmd("toggle-autocomplete").menu,
                             get_cmd("toggle-autosuggest").menu,
                             get_cmd("toggle-autoinspect").menu,
-                        ],
+                        ),
                         description="Turn code assistance tools on or off",
                     ),
                     get_cmd("toggle-run-after-external-edit").menu,
-                ],
+                ),
                 description="Make changes to euporie's configuration",
             ),
             MenuItem(
                 "Help",
-                children=[
+                children=(
                     get_cmd("show-command-palette").menu,
                     get_cmd("keyboard-shortcuts").menu,
                     get_cmd("view-documentation").menu,
@@ -478,10 +472,10 @@ class NotebookApp(BaseApp):
                     get_cmd("view-logs").menu,
                     separator,
                     get_cmd("about").menu,
-                ],
+                ),
                 description="Get help",
             ),
-        ]
+        )
 
     # ################################### Commands ####################################
 
@@ -771,9 +771,6 @@ class Notebook(BaseNotebook):
     @add_cmd(
         filter=notebook_has_focus & ~buffer_has_focus & ~display_has_focus,
     )
-    @add_cmd(
-        filter=notebook_has_focus,
-    )
     def _scroll_up() -> NotImplementedOrNone:
         """Scroll the page up a line."""
         nb = get_app().tab
@@ -785,9 +782,6 @@ class Notebook(BaseNotebook):
     @add_cmd(
         filter=notebook_has_focus & ~buffer_has_focus & ~display_has_focus,
     )
-    @add_cmd(
-        filter=notebook_has_focus,
-    )
     def _scroll_down() -> NotImplementedOrNone:
         """Scroll the page down a line."""
         nb = get_app().tab
@@ -6,11 +6,12 @@ import io
 import logging
 import os
 import sys
-from functools import partial
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, cast
 
 from prompt_toolkit.layout.containers import DynamicContainer, FloatContainer, Window
 from prompt_toolkit.output.defaults import create_output
+from prompt_toolkit.output.plain_text import PlainTextOutput
 from prompt_toolkit.output.vt100 import Vt100_Output
 from upath import UPath
 
@@ -22,9 +23,10 @@ from euporie.preview.tabs.notebook import PreviewNotebook
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from typing import Any, TextIO
+    from typing import Any, Callable, TextIO
 
     from prompt_toolkit.application.application import _AppResult
+    from prompt_toolkit.data_structures import Size
     from prompt_toolkit.layout.containers import Float
     from prompt_toolkit.output import Output
 
@@ -33,6 +35,41 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+@lru_cache
+def _stderr_get_size() -> Callable[[], Size]:
+    """Return a function which gets the size of the terminal attached to stderr.
+
+    This is used as the size of every preview output, so the terminal size is known
+    even when the output is being piped or redirected to a non-tty.
+    """
+    return create_output(stdout=sys.stderr).get_size
+
+
+class PreviewOutput(Vt100_Output):
+    """A Vt100 output which records the file it is writing to."""
+
+    def __init__(self, *args: Any, output_file: TextIO, **kwargs: Any) -> None:
+        """Create a new output, recording the output file in case it is paged."""
+        super().__init__(*args, **kwargs)
+        self.output_file = output_file
+
+
+class PlainTextPreviewOutput(PlainTextOutput):
+    """A plain text output which records the file it is writing to."""
+
+    def __init__(
+        self, stdout: TextIO, get_size: Callable[[], Size], output_file: TextIO
+    ) -> None:
+        """Create a new output, recording the output file in case it is paged."""
+        super().__init__(stdout)
+        self._get_size = get_size
+        self.output_file = output_file
+
+    def get_size(self) -> Size:
+        """Return the size of the output."""
+        return self._get_size()
+
+
 class PreviewApp(BaseApp):
     """Preview app.
 
@@ -83,11 +120,17 @@ class PreviewApp(BaseApp):
         if self.config.page:
             from pydoc import pager
 
-            output_file = getattr(self.output, "output_file")  # noqa: B009
-            if output_file is not None:
-                output_file.seek(0)
-                data = output_file.read()
-                pager(data)
+            if (output_file := getattr(self.output, "output_file", None)) is not None:
+                # Read the whole file directly from its file descriptor, bypassing
+                # the text & buffered IO layers
+                output_file.flush()
+                fd = output_file.fileno()
+                os.lseek(fd, 0, os.SEEK_SET)
+                size = os.fstat(fd).st_size
+                data = bytearray()
+                while len(data) < size and (chunk := os.read(fd, size - len(data))):
+                    data += chunk
+                pager(data.decode(output_file.encoding))
         if exception is not None:
             super().exit(exception=exception, style=style)
         elif result is not None:
@@ -126,7 +169,9 @@ class PreviewApp(BaseApp):
             # Use a temporary file as display output if we are going to page the output
             from tempfile import TemporaryFile
 
-            output_file = TemporaryFile("w+")
+            # Output is written sequentially, so use a large buffer to reduce the
+            # number of writes
+            output_file = TemporaryFile("w+", buffering=1024 * 1024)
             # Make this file look like a tty so we get colorful output
             output_file = cast("TextIO", PseudoTTY(output_file, isatty=True))
 
@@ -141,7 +186,9 @@ class PreviewApp(BaseApp):
                 output_file = sys.stderr
             else:
                 try:
-                    output_file = cls.config.output_file.open("w+")
+                    output_file = cls.config.output_file.open(
+                        "w+", buffering=256 * 1024
+                    )
                 except (
                     FileNotFoundError,
                     PermissionError,
@@ -173,20 +220,34 @@ class PreviewApp(BaseApp):
         # Do not use stderr instead of stdout if stdout is not a tty
         output = create_output(cast("TextIO", output_file), always_prefer_tty=False)
 
-        # Use the width and height of stderr (this gives us the terminal size even if
-        # output is being piped to a non-tty)
-        setattr(  # noqa B010
-            output, "get_size", create_output(stdout=sys.stderr).get_size
-        )
-        # Attach the output file to the output in case we need to page it
-        setattr(output, "output_file", output_file)  # noqa B010
+        if isinstance(output, Vt100_Output):
+            output = PreviewOutput(
+                stdout=output.stdout,
+                # Use the width and height of stderr
+                get_size=_stderr_get_size(),
+                term=output.term,
+                default_color_depth=output.default_color_depth,
+                enable_bell=output.enable_bell,
+                enable_cpr=output.enable_cpr,
+                # Attach the output file to the output in case we need to page it
+                output_file=output_file,
+            )
+        elif isinstance(output, PlainTextOutput):
+            # Output is being piped or redirected to a non-tty
+            output = PlainTextPreviewOutput(
+                stdout=output.stdout,
+                get_size=_stderr_get_size(),
+                output_file=output_file,
+            )
+        else:
+            # Patch any other type of output with the stderr size and output file
+            setattr(output, "get_size", _stderr_get_size())  # noqa: B010
+            setattr(output, "output_file", output_file)  # noqa: B010
 
         return output
 
     def _redraw(self, render_as_done: bool = False) -> None:
         """Ensure the output is always rendered as done."""
-        # import time
-        # time.sleep(0.1)
         super()._redraw(render_as_done=True)
 
     # ################################### Settings ####################################
@@ -190,6 +190,12 @@ def test_command_key_handler() -> None:
     check_cmd_key_handler(async_handler_without_args_notimplemented, check, 0, True)
 
 
+def test_command_handlers_cached(command: Command) -> None:
+    """Wrapped handlers are created once per command and re-used."""
+    assert command.key_handler is command.key_handler
+    assert command.menu_handler is command.menu_handler
+
+
 def test_command_bind(command: Command) -> None:
     """Adding binding keys adds a key and key-binding."""
     key_bindings = Mock()
@@ -234,6 +240,22 @@ def test_command_menu_handler(command: Command, mock_handler: CommandHandler) ->
     assert result is None
 
 
+def test_command_menu_handler_async() -> None:
+    """Async command handlers are run as background tasks from menus."""
+    check = {"handled": False}
+
+    async def async_handler() -> None:
+        check["handled"] = True
+
+    cmd = Command(async_handler)
+    app = Mock(spec=Application)
+    with set_app(app):
+        cmd.menu_handler()
+    app.create_background_task.assert_called_once()
+    asyncio.run(app.create_background_task.call_args_list[0].args[0])
+    assert check["handled"]
+
+
 def test_command_menu(command: Command) -> None:
     """Command's menu items are created as expected."""
     command.bind(Mock(), [("a", "b")])
@@ -265,6 +287,17 @@ def test_add_cmd() -> None:
     assert commands["my_cmd_2"].description == "This is my second command"
 
 
+def test_add_cmd_twice(caplog: pytest.LogCaptureFixture) -> None:
+    """Registering the same handler twice logs a warning."""
+
+    @add_cmd(name="my_dup_cmd")
+    @add_cmd(name="my_dup_cmd")
+    def my_dup_cmd() -> None:
+        pass
+
+    assert "registered more than once" in caplog.text
+
+
 def test_get_cmd() -> None:
     """Command are retrieved."""
 
@@ -0,0 +1,78 @@
+"""Test cell output widgets."""
+
+from __future__ import annotations
+
+from euporie.core.widgets.cell_outputs import (
+    CellOutput,
+    CellOutputArea,
+    _calculate_mime_rank,
+)
+
+
+def test_calculate_mime_rank() -> None:
+    """Richer mime types are ranked before plainer ones."""
+    data = {
+        "text/plain": "plain",
+        "text/html": "<b>html</b>",
+        "image/png": "",
+        "application/json": {},
+    }
+    assert [mime for mime, _ in sorted(data.items(), key=_calculate_mime_rank)] == [
+        "application/json",
+        "image/png",
+        "text/html",
+        "text/plain",
+    ]
+
+    # Plain text with escape sequences is ranked above markdown
+    assert _calculate_mime_rank(("text/plain", "\x1b[31mred")) < _calculate_mime_rank(
+        ("text/markdown", "**red**")
+    )
+    # Rankings do not depend on previously ranked data
+    assert _calculate_mime_rank(("text/plain", "plain")) > _calculate_mime_rank(
+        ("text/html", "<b>html</b>")
+    )
+    # Unknown mime types match the wildcard rank
+    assert _calculate_mime_rank(("foo", "")) == _calculate_mime_rank(("bar/baz", ""))
+
+
+def test_cell_output_data() -> None:
+    """Output data is sorted by rank and refreshed when the json changes."""
+    output = CellOutput(
+        {"output_type": "stream", "name": "stdout", "text": "a"}, parent=None
+    )
+    assert output.data == {"stream/stdout": "a"}
+
+    # In-place modifications are picked up when the output is updated
+    output.json["text"] += "b"
+    output.update()
+    assert output.data == {"stream/stdout": "ab"}
+
+    # Replacing the json resets the data
+    output.json = {
+        "output_type": "execute_result",
+        "data": {"text/plain": "plain", "text/html": "<b>html</b>"},
+    }
+    assert list(output.data) == ["text/html", "text/plain"]
+    assert output.selected_mime == "text/html"
+
+
+def test_cell_output_area_streams() -> None:
+    """Stream outputs are merged, and appended outputs are added."""
+    json = [{"output_type": "stream", "name": "stdout", "text": "a"}]
+    area = CellOutputArea(json, parent=None)
+    json = [
+        *json,
+        {"output_type": "stream", "name": "stdout", "text": "a"},
+        {"output_type": "error", "ename": "E", "evalue": "", "traceback": []},
+    ]
+    area.json = json
+    assert len(area._json) == 3
+    assert [output.json.get("text") for output in area.rendered_outputs] == [
+        "aa",
+        None,
+    ]
+
+    # Outputs are rebuilt if existing outputs are removed
+    area.json = json[2:]
+    assert [output.json.get("ename") for output in area.rendered_outputs] == ["E"]
@@ -0,0 +1,108 @@
+"""Test layout widgets."""
+
+from __future__ import annotations
+
+from prompt_toolkit.data_structures import Point
+from prompt_toolkit.layout.containers import Window
+from prompt_toolkit.mouse_events import MouseButton, MouseEvent, MouseEventType
+
+from euporie.core.widgets.layout import (
+    AccordionSplit,
+    TabBarControl,
+    TabBarTab,
+    TabbedSplit,
+)
+
+
+def test_tab_bar_handler_regions() -> None:
+    """Clicks on the tab-bar are mapped to the correct tab's callbacks."""
+
+    def activate_a() -> None:
+        pass
+
+    def close_a() -> None:
+        pass
+
+    def activate_b() -> None:
+        pass
+
+    control = TabBarControl(
+        [TabBarTab("ab", activate_a, on_close=close_a), TabBarTab("c", activate_b)],
+        active=0,
+        closeable=True,
+    )
+    control.create_content(width=40, height=2)
+    assert [control.handler_at(col) for col in range(14)] == [
+        None,
+        # First tab: left edge, title, padding, close button, right edge
+        *[activate_a] * 4,
+        close_a,
+        activate_a,
+        None,
+        # Second tab, with no close callback
+        *[activate_b] * 3,
+        None,
+        activate_b,
+        None,
+    ]
+    assert control.handler_at(39) is None
+
+
+def test_stacked_split_active() -> None:
+    """Changing the active child does not rebuild stacked split containers."""
+    accordion = AccordionSplit([Window(), Window()], titles=["a", "b"], active=0)
+    container = accordion._container
+    accordion.toggle(1)
+    assert accordion.active == 1
+    assert accordion._container is container
+    accordion.toggle(1)
+    assert accordion.active is None
+
+    # Sections are only re-created for children which change
+    rows = list(container.children)
+    accordion.titles = ["c", "d"]
+    assert container.children == rows
+    assert accordion.title_text(1)[-1][1] == "d"
+    accordion.children = [accordion.children[0], Window()]
+    assert container.children[0] is rows[0]
+    assert container.children[1] is not rows[1]
+
+    tabbed = TabbedSplit([Window(), Window()], titles=["a", "b"])
+    tabs = tabbed.control.tabs
+    tabbed.active = 1
+    assert tabbed.control.active == 1
+    assert tabbed.control.tabs == tabs
+
+
+def test_tab_bar_scroll() -> None:
+    """Scrolling the tab-bar activates neighbouring tabs up to either end."""
+    active = [0]
+    control = TabBarControl(
+        [TabBarTab(str(i), lambda i=i: active.__setitem__(0, i)) for i in range(2)],
+        active=lambda: active[0],
+    )
+
+    def scroll(event_type: MouseEventType) -> object:
+        return control.mouse_handler(
+            MouseEvent(Point(0, 0), event_type, MouseButton.NONE, frozenset())
+        )
+
+    assert scroll(MouseEventType.SCROLL_UP) is NotImplemented
+    assert scroll(MouseEventType.SCROLL_DOWN) is None
+    assert active == [1]
+    assert scroll(MouseEventType.SCROLL_DOWN) is NotImplemented
+    assert scroll(MouseEventType.SCROLL_UP) is None
+    assert active == [0]
+
+    # A stale active index past the last tab is not deactivated
+    active[0] = 2
+    assert scroll(MouseEventType.SCROLL_DOWN) is None
+    assert active == [1]
+
+
+def test_tab_bar_fragment_budget() -> None:
+    """The tab-bar emits a fixed number of fragments per tab."""
+    tabs = [TabBarTab(f"tab {i}", print, on_close=print) for i in range(20)]
+    top_line, tab_line = TabBarControl(tabs, active=3, closeable=True).render(200)
+    assert len(top_line) <= 3 * len(tabs) + 1
+    assert len(tab_line) <= 6 * len(tabs) + 2
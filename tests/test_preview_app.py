@@ -0,0 +1,32 @@
+"""Test the preview app."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from upath import UPath
+
+from euporie.preview.app import PlainTextPreviewOutput, PreviewApp, _stderr_get_size
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_load_output_redirected(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Redirected output uses the size of stderr and records the output file."""
+    settings = PreviewApp.config.settings
+    monkeypatch.setattr(settings["page"], "_value", False)
+    monkeypatch.setattr(settings["color_depth"], "_value", None)
+    monkeypatch.setattr(settings["output_file"], "_value", UPath(tmp_path / "out"))
+
+    output = PreviewApp.load_output()
+    try:
+        assert isinstance(output, PlainTextPreviewOutput)
+        assert output.get_size() == _stderr_get_size()()
+        assert output.output_file.name == str(tmp_path / "out")
+    finally:
+        output.output_file.close()